@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-15 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_delete_appropriationaccountbalancesquarterly'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='treasuryappropriationaccount',
+            name='tas_rendering_label',
+            field=models.TextField(blank=True, db_index=True, null=True),
+        ),
+    ]
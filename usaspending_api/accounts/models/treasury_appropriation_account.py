@@ -13,7 +13,7 @@ class TreasuryAppropriationAccount(DataSourceTrackedModel):
 
     treasury_account_identifier = models.AutoField(primary_key=True)
     federal_account = models.ForeignKey("FederalAccount", models.DO_NOTHING, null=True)
-    tas_rendering_label = models.TextField(blank=True, null=True)
+    tas_rendering_label = models.TextField(blank=True, null=True, db_index=True)
     allocation_transfer_agency_id = models.TextField(blank=True, null=True)
     awarding_toptier_agency = models.ForeignKey(
         "references.ToptierAgency",
@@ -2,11 +2,13 @@ import pytest
 
 from datetime import datetime, timezone
 from model_bakery import baker
-from usaspending_api.accounts.v2.filters.account_download import account_download_filter
+from usaspending_api.accounts.v2.filters.account_download import account_download_filter, gtas_balances_derivations
+from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.download.models import (
     AppropriationAccountBalancesDownloadView,
     FinancialAccountsByAwardsDownloadView,
     FinancialAccountsByProgramActivityObjectClassDownloadView,
+    GTASSF133BalancesDownloadView,
 )
 
 
@@ -425,3 +427,63 @@ def test_frec_agency_filter(submissions):
         "award_financial", FinancialAccountsByAwardsDownloadView, {"agency": "-9999", "fy": 1700, "quarter": 1}
     )
     assert queryset.count() == 1
+
+
+def test_agency_filter_unknown_agency(submissions):
+    """ Ensure an unknown agency is rejected until it is created """
+    with pytest.raises(InvalidParameterException):
+        account_download_filter(
+            "award_financial", FinancialAccountsByAwardsDownloadView, {"agency": "-9997", "fy": 1700, "quarter": 1}
+        )
+
+    baker.make("references.ToptierAgency", toptier_agency_id=-9997, toptier_code="NEW")
+    queryset = account_download_filter(
+        "award_financial", FinancialAccountsByAwardsDownloadView, {"agency": "-9997", "fy": 1700, "quarter": 1}
+    )
+    assert queryset.count() == 0
+
+
+@pytest.mark.django_db
+def test_gtas_balances_agency_identifier_names():
+    """ Ensure the view's agency names line up with the agency codes derived for the GTAS download """
+    baker.make("references.CGAC", cgac_code="011", agency_name="Agency 011")
+    baker.make("references.CGAC", cgac_code="012", agency_name="Agency 012")
+    baker.make("references.CGAC", cgac_code="097", agency_name="Agency 097")
+    tas = baker.make(
+        "accounts.TreasuryAppropriationAccount",
+        agency_id="097",
+        allocation_transfer_agency_id="011",
+        tas_rendering_label="012-X-0300-000",
+    )
+
+    baker.make("references.GTASSF133Balances", fiscal_year=1700, fiscal_period=3, tas_rendering_label="012-X-0100-000")
+    baker.make(
+        "references.GTASSF133Balances",
+        fiscal_year=1700,
+        fiscal_period=3,
+        tas_rendering_label="011-012-2020/2021-0200-000",
+    )
+    baker.make(
+        "references.GTASSF133Balances",
+        fiscal_year=1700,
+        fiscal_period=3,
+        tas_rendering_label="012-X-0300-000",
+        treasury_account_identifier=tas,
+    )
+
+    queryset = (
+        GTASSF133BalancesDownloadView.objects.annotate(**gtas_balances_derivations({}))
+        .order_by("tas_rendering_label")
+        .values_list(
+            "tas_rendering_label",
+            "agency_identifier_code",
+            "agency_identifier_name",
+            "allocation_transfer_agency_identifier_code",
+            "allocation_transfer_agency_identifier_name",
+        )
+    )
+    assert list(queryset) == [
+        ("011-012-2020/2021-0200-000", "012", "Agency 012", "011", "Agency 011"),
+        ("012-X-0100-000", "012", "Agency 012", None, None),
+        ("012-X-0300-000", "097", "Agency 097", "011", "Agency 011"),
+    ]
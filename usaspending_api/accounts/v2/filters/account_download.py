@@ -27,6 +27,7 @@ Account Breakdown by Award (C file):
         2. Group by Federal Account
 """
 from datetime import timezone, datetime
+from functools import lru_cache
 
 from django.db.models import (
     Case,
@@ -36,7 +37,6 @@ from django.db.models import (
     Func,
     Max,
     Q,
-    Subquery,
     Sum,
     TextField,
     Value,
@@ -56,7 +56,7 @@ from usaspending_api.common.helpers.orm_helpers import (
 )
 from usaspending_api.download.filestreaming import NAMING_CONFLICT_DISCRIMINATOR
 from usaspending_api.download.v2.download_column_historical_lookups import query_paths
-from usaspending_api.references.models import ToptierAgency, CGAC
+from usaspending_api.references.models import ToptierAgency
 from usaspending_api.settings import HOST
 from usaspending_api.submissions.helpers import (
     ClosedPeriod,
@@ -113,9 +113,7 @@ def build_query_filters(account_type, filters, account_level):
     )
 
     if filters.get("agency") and filters["agency"] != "all":
-        if not ToptierAgency.objects.filter(toptier_agency_id=filters["agency"]).exists():
-            raise InvalidParameterException("Agency with that ID does not exist")
-        query_filters[f"{tas_id}__funding_toptier_agency_id"] = filters["agency"]
+        query_filters[f"{tas_id}__funding_toptier_agency_id"] = _get_toptier_agency_id(filters["agency"])
 
     if filters.get("federal_account") and filters["federal_account"] != "all":
         if not FederalAccount.objects.filter(id=filters["federal_account"]).exists():
@@ -136,6 +134,19 @@ def build_query_filters(account_type, filters, account_level):
     return query_filters, tas_id
 
 
+@lru_cache(maxsize=512)
+def _get_toptier_agency_id(toptier_agency_id):
+    """
+    Toptier Agencies are reloaded outside of the API process, so a found agency ID is cached until the process
+    recycles. Renaming an agency has no effect on the cached ID, but a removed agency keeps passing validation until
+    then. Since exceptions are not cached by lru_cache an unknown ID is checked again on the next request.
+    """
+    agency_id = ToptierAgency.objects.filter(toptier_agency_id=toptier_agency_id).values_list("pk", flat=True).first()
+    if agency_id is None:
+        raise InvalidParameterException("Agency with that ID does not exist")
+    return agency_id
+
+
 def get_gtas_submission_filter():
     return (
         DABSSubmissionWindowSchedule.objects.filter(
@@ -562,7 +573,8 @@ def gtas_balances_derivations(derived_fields):
         output_field=TextField(),
     )
 
-    # These derivations appear in the final download
+    # These derivations appear in the final download; the agency identifier codes must match the derivations used to
+    # join the agency names in vw_gtas_sf133_balances_download.sql
     derived_fields["allocation_transfer_agency_identifier_code"] = Coalesce(
         F("treasury_account_identifier__allocation_transfer_agency_id"),
         Case(
@@ -594,13 +606,7 @@ def gtas_balances_derivations(derived_fields):
                 ~Q(tas_component_third_from_end=Value("X")),
                 then=Func(
                     Func(
-                        Func(
-                            Func(F("tas_rendering_label"), function="REVERSE", output_field=TextField()),
-                            Value("-"),
-                            Value(3),
-                            function="SPLIT_PART",
-                            output_field=TextField(),
-                        ),
+                        F("tas_component_third_from_end"),
                         Value("/"),
                         Value(2),
                         function="SPLIT_PART",
@@ -622,13 +628,7 @@ def gtas_balances_derivations(derived_fields):
                 ~Q(tas_component_third_from_end=Value("X")),
                 then=Func(
                     Func(
-                        Func(
-                            Func(F("tas_rendering_label"), function="REVERSE", output_field=TextField()),
-                            Value("-"),
-                            Value(3),
-                            function="SPLIT_PART",
-                            output_field=TextField(),
-                        ),
+                        F("tas_component_third_from_end"),
                         Value("/"),
                         Value(1),
                         function="SPLIT_PART",
@@ -677,11 +677,5 @@ def gtas_balances_derivations(derived_fields):
         function="REVERSE",
         output_field=TextField(),
     )
-    derived_fields["agency_identifier_name"] = Subquery(
-        CGAC.objects.filter(cgac_code=OuterRef("agency_identifier_code")).values("agency_name")
-    )
-    derived_fields["allocation_transfer_agency_identifier_name"] = Subquery(
-        CGAC.objects.filter(cgac_code=OuterRef("allocation_transfer_agency_identifier_code")).values("agency_name")
-    )
 
     return derived_fields
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-15 20:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awards', '0096_removing_subaward_models'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='financialaccountsbyawards',
+            index=models.Index(fields=['treasury_account', 'submission'], name='faba_tas_submission_idx'),
+        ),
+    ]
@@ -168,5 +168,7 @@ class FinancialAccountsByAwards(AbstractFinancialAccountsByAwards):
                 ],
                 name="faba_subid_awardkey_sums_idx",
                 condition=Q(disaster_emergency_fund__in=["L", "M", "N", "O", "P", "U", "V"]),
-            )
+            ),
+            # Supports account downloads, which narrow to the TAS of an agency and then to a set of submissions
+            models.Index(fields=["treasury_account", "submission"], name="faba_tas_submission_idx"),
         ]
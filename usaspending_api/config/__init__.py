@@ -2,7 +2,7 @@ import argparse
 import os
 import sys
 from functools import lru_cache
-from typing import Type, Union
+from typing import FrozenSet, Optional, Tuple, Type, Union
 
 from usaspending_api.config.envs import ENV_CODE_VAR, ENVS
 from usaspending_api.config.envs.default import DefaultConfig
@@ -17,7 +17,9 @@ _FALLBACK_ENV_CODE = "lcl"
 _CLI_CONFIG_ARG = "config"
 
 
-def _parse_config_arg() -> dict:
+def _parse_config_arg(argv: Optional[Tuple[str, ...]] = None) -> dict:
+    if argv is None:
+        argv = tuple(sys.argv)
     parser = argparse.ArgumentParser()
 
     class _KeyValueArgParser(argparse.Action):
@@ -54,18 +56,30 @@ def _parse_config_arg() -> dict:
     )
 
     config_arg = None
-    if len(sys.argv) > 1:
-        args, unknown_args = parser.parse_known_args()
+    if len(argv) > 1:
+        args, unknown_args = parser.parse_known_args(list(argv[1:]))
         if args.config:
             config_arg = args.config
     return config_arg
 
 
-@lru_cache()
 def _load_config(env_code=None) -> Type[DefaultConfig]:
-    """Compile runtime-environment-specific configuration inputs into a final collection configuration values."""
+    """Compile runtime-environment-specific configuration inputs into a final collection configuration values.
+
+    Results are cached on the inputs that determine them (runtime env code, CLI args and environment variables), so
+    repeated calls with unchanged inputs reuse the already-validated config object. Inputs outside of that key (e.g.
+    .env file contents or a patched ENVS) require calling _load_config_for_inputs.cache_clear().
+    """
     if not env_code:
         env_code = os.environ.get(ENV_CODE_VAR, _FALLBACK_ENV_CODE)
+    return _load_config_for_inputs(env_code, tuple(sys.argv), frozenset(os.environ.items()))
+
+
+@lru_cache(maxsize=32)
+def _load_config_for_inputs(
+    env_code: str, argv: Tuple[str, ...], env_snapshot: FrozenSet[Tuple[str, str]]
+) -> Type[DefaultConfig]:
+    # env_snapshot is only part of the cache key; the config classes read os.environ themselves
     runtime_env = next((env for env in ENVS if env["code"] == env_code), None)
     if not runtime_env:
         raise KeyError(
@@ -73,7 +87,7 @@ def _load_config(env_code=None) -> Type[DefaultConfig]:
             f"Check that you are supplying the correct runtime env specifier in the {ENV_CODE_VAR} "
             f"environment variable when running this program"
         )
-    cli_config_overrides = _parse_config_arg()
+    cli_config_overrides = _parse_config_arg(argv)
     return runtime_env["constructor"](**cli_config_overrides) if cli_config_overrides else runtime_env["constructor"]()
 
 
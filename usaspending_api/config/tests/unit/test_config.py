@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 import re
 import os
+from types import MappingProxyType
 import pytest
 from pathlib import Path
 from pprint import pprint
@@ -11,8 +12,8 @@ from pydantic import validator, root_validator, PostgresDsn, SecretStr
 from pydantic.fields import ModelField
 from pydantic.error_wrappers import ValidationError
 
-from usaspending_api.config import CONFIG, _load_config
-from usaspending_api.config.envs import ENV_CODE_VAR
+from usaspending_api.config import CONFIG, _load_config, _load_config_for_inputs
+from usaspending_api.config.envs import ENV_CODE_VAR, ENVS
 from usaspending_api.config.envs.default import _PROJECT_ROOT_DIR
 from usaspending_api.config.utils import (
     eval_default_factory,
@@ -25,6 +26,21 @@ from usaspending_api.config.envs.local import LocalConfig
 from unittest import mock
 
 _ENV_VAL = "component_name_set_in_env"
+_DOTENV_VAL = "a_test_verifying_dotenv_overrides_runtime_env_default_config"
+_DEFAULT_LOCAL_CFG = LocalConfig()
+
+
+@pytest.fixture(scope="session")
+def component_name_dotenv_path(tmp_path_factory):
+    """A .env file, written once per session, that overrides COMPONENT_NAME with _DOTENV_VAL"""
+    dotenv_file = tmp_path_factory.mktemp("config_dir") / ".env"
+    # Must use some of the default overrides from .env, like USASPENDING_DB_*. Fallback to .env.template if not existing
+    shutil.copy(str(_PROJECT_ROOT_DIR / ".env.template"), dotenv_file)
+    if Path(_PROJECT_ROOT_DIR / ".env").exists():
+        shutil.copy(str(_PROJECT_ROOT_DIR / ".env"), dotenv_file)
+    with open(dotenv_file, "a") as f:
+        f.write(f"COMPONENT_NAME={_DOTENV_VAL}")
+    return str(dotenv_file)
 
 
 class _UnitTestBaseConfig(DefaultConfig):
@@ -386,6 +402,20 @@ _UNITTEST_ENVS_DICTS = [
     },
 ]
 
+# Frozen once for the module: the real runtime envs plus the unit test ones
+_PATCHED_ENVS = tuple(MappingProxyType(env) for env in (*ENVS, *_UNITTEST_ENVS_DICTS))
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_envs():
+    """Make the unit test runtime envs resolvable, alongside the real ones, for every test in this module"""
+    # Recall, it needs to be patched where imported, not where it lives
+    # ENVS is not part of the config cache key, so configs loaded against the unpatched ENVS must not be reused
+    _load_config_for_inputs.cache_clear()
+    with mock.patch("usaspending_api.config.ENVS", _PATCHED_ENVS):
+        yield
+    _load_config_for_inputs.cache_clear()
+
 
 def test_config_values():
     """Test that config values are picked up. Also convenient for eyeballing the parsed config vals when
@@ -404,7 +434,6 @@ def test_config_values():
 def test_config_loading():
     """Test the _load_config runs without error"""
     with mock.patch.dict(os.environ, {ENV_CODE_VAR: LocalConfig.ENV_CODE}):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
         pprint(cfg.dict())
 
@@ -1066,30 +1095,15 @@ def test_dotenv_file_template_found(tmpdir):
     assert str(proj_root_dir) in env_file_path
 
 
-def test_override_with_dotenv_file(tmpdir):
+def test_override_with_dotenv_file(component_name_dotenv_path):
     """Ensure that when .env files are used, they overwrite default values in the instantiated config class,
     rather than the other way around."""
-    cfg = LocalConfig()
-    assert cfg.COMPONENT_NAME == "USAspending API"
-    dotenv_val = "a_test_verifying_dotenv_overrides_runtime_env_default_config"
+    assert _DEFAULT_LOCAL_CFG.COMPONENT_NAME == "USAspending API"
 
-    tmp_config_dir = tmpdir.mkdir("config_dir")
-    dotenv_file = tmp_config_dir.join(".env")
-    # Must use some of the default overrides from .env, like USASPENDING_DB_*. Fallback to .env.template if not existing
-    shutil.copy(str(_PROJECT_ROOT_DIR / ".env.template"), dotenv_file)
-    if Path(_PROJECT_ROOT_DIR / ".env").exists():
-        shutil.copy(str(_PROJECT_ROOT_DIR / ".env"), dotenv_file)
-    with open(dotenv_file, "a"):
-        dotenv_file.write(f"COMPONENT_NAME={dotenv_val}", "a")
-    dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
-    cfg = LocalConfig(_env_file=dotenv_path)
-    assert cfg.COMPONENT_NAME == dotenv_val
+    cfg = LocalConfig(_env_file=component_name_dotenv_path)
+    assert cfg.COMPONENT_NAME == _DOTENV_VAL
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_override_with_dotenv_file_for_subclass_overridden_var(tmpdir):
     """Ensure that when .env files are used, they overwrite default values in the instantiated config class,
     rather than the other way around... EVEN when that value was overrided in a subclass"""
@@ -1099,7 +1113,6 @@ def test_override_with_dotenv_file_for_subclass_overridden_var(tmpdir):
             ENV_CODE_VAR: _UnitTestSubConfig.ENV_CODE,
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. override even if originally defined at the grandparent config level
@@ -1118,16 +1131,11 @@ def test_override_with_dotenv_file_for_subclass_overridden_var(tmpdir):
             dotenv_file.write(f"COMPONENT_NAME={dotenv_val}\n" f"UNITTEST_CFG_A={dotenv_val_a}", "a")
         dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
 
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _UnitTestSubConfig(_env_file=dotenv_path)
         assert cfg.COMPONENT_NAME == dotenv_val
         assert cfg.UNITTEST_CFG_A == dotenv_val_a
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_override_with_dotenv_file_for_subclass_only_var(tmpdir):
     """Ensure that when .env files are used, they overwrite default values in the instantiated config class,
     rather than the other way around... EVEN when that value only exists in a subclass"""
@@ -1137,7 +1145,6 @@ def test_override_with_dotenv_file_for_subclass_only_var(tmpdir):
             ENV_CODE_VAR: _UnitTestSubConfig.ENV_CODE,
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. override even if originally defined at the grandparent config level
@@ -1155,15 +1162,10 @@ def test_override_with_dotenv_file_for_subclass_only_var(tmpdir):
             dotenv_file.write(f"SUB_UNITTEST_3={dotenv_sub_3}", "a")
         dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
 
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _UnitTestSubConfig(_env_file=dotenv_path)
         assert cfg.SUB_UNITTEST_3 == dotenv_sub_3
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_override_with_dotenv_file_for_validated_var(tmpdir):
     """Ensure that when .env files are used, they overwrite default values in the instantiated config class,
     rather than the other way around... EVEN when that value is provided by a validator factory function"""
@@ -1173,7 +1175,6 @@ def test_override_with_dotenv_file_for_validated_var(tmpdir):
             ENV_CODE_VAR: _UnitTestBaseConfig.ENV_CODE,
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. override even if originally defined at the grandparent config level
@@ -1193,15 +1194,10 @@ def test_override_with_dotenv_file_for_validated_var(tmpdir):
         print(dotenv_file.read_text("utf-8"))
         dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
 
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _UnitTestBaseConfig(_env_file=dotenv_path)
         assert cfg.UNITTEST_CFG_U == dotenv_val
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_override_with_dotenv_file_for_root_validated_var(tmpdir):
     """Ensure that when .env files are used, they overwrite default values in the instantiated config class,
     rather than the other way around... EVEN when that value is provided by a root_validator factory function"""
@@ -1211,7 +1207,6 @@ def test_override_with_dotenv_file_for_root_validated_var(tmpdir):
             ENV_CODE_VAR: _UnitTestBaseConfig.ENV_CODE,
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. override even if originally defined at the grandparent config level
@@ -1230,15 +1225,10 @@ def test_override_with_dotenv_file_for_root_validated_var(tmpdir):
             dotenv_file.write(f"{var_name}={dotenv_val}", "a")
         dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
 
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _UnitTestBaseConfig(_env_file=dotenv_path)
         assert cfg.UNITTEST_CFG_AJ == dotenv_val
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_override_with_dotenv_file_for_subclass_overriding_validated_var(tmpdir):
     """Ensure that when .env files are used, they overwrite default values in the instantiated config class,
     rather than the other way around... EVEN when that value is provided by a subclass validator factory function that
@@ -1249,7 +1239,6 @@ def test_override_with_dotenv_file_for_subclass_overriding_validated_var(tmpdir)
             ENV_CODE_VAR: _UnitTestSubConfig.ENV_CODE,
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. override even if originally defined at the grandparent config level
@@ -1268,15 +1257,10 @@ def test_override_with_dotenv_file_for_subclass_overriding_validated_var(tmpdir)
             dotenv_file.write(f"{var_name}={dotenv_val}", "a")
         dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
 
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _UnitTestSubConfig(_env_file=dotenv_path)
         assert cfg.UNITTEST_CFG_Y == dotenv_val
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_override_with_dotenv_file_for_subclass_overriding_root_validated_var(tmpdir):
     """Ensure that when .env files are used, they overwrite default values in the instantiated config class,
     rather than the other way around... EVEN when that value is provided by a subclass root_validator factory function
@@ -1287,7 +1271,6 @@ def test_override_with_dotenv_file_for_subclass_overriding_root_validated_var(tm
             ENV_CODE_VAR: _UnitTestSubConfig.ENV_CODE,
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. override even if originally defined at the grandparent config level
@@ -1306,7 +1289,6 @@ def test_override_with_dotenv_file_for_subclass_overriding_root_validated_var(tm
             dotenv_file.write(f"{var_name}={dotenv_val}", "a")
         dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
 
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _UnitTestSubConfig(_env_file=dotenv_path)
         assert cfg.UNITTEST_CFG_AK == dotenv_val
 
@@ -1322,26 +1304,15 @@ def test_override_with_env_var(tmpdir):
         assert cfg.COMPONENT_NAME == _ENV_VAL
 
 
-def test_override_dotenv_file_with_env_var(tmpdir):
+def test_override_dotenv_file_with_env_var(component_name_dotenv_path):
     """Ensure that when .env files are used, AND the same value is declared as an environment var, the env var takes
     precedence over the value in .env"""
     # Verify default if nothing overriding
-    cfg = LocalConfig()
-    assert cfg.COMPONENT_NAME == "USAspending API"
-    dotenv_val = "a_test_verifying_dotenv_overrides_runtime_env_default_config"
+    assert _DEFAULT_LOCAL_CFG.COMPONENT_NAME == "USAspending API"
 
     # Now the .env file takes precedence
-    tmp_config_dir = tmpdir.mkdir("config_dir")
-    dotenv_file = tmp_config_dir.join(".env")
-    # Must use some of the default overrides from .env, like USASPENDING_DB_*. Fallback to .env.template if not existing
-    shutil.copy(str(_PROJECT_ROOT_DIR / ".env.template"), dotenv_file)
-    if Path(_PROJECT_ROOT_DIR / ".env").exists():
-        shutil.copy(str(_PROJECT_ROOT_DIR / ".env"), dotenv_file)
-    with open(dotenv_file, "a"):
-        dotenv_file.write(f"COMPONENT_NAME={dotenv_val}", "a")
-    dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
-    cfg = LocalConfig(_env_file=dotenv_path)
-    assert cfg.COMPONENT_NAME == dotenv_val
+    cfg = LocalConfig(_env_file=component_name_dotenv_path)
+    assert cfg.COMPONENT_NAME == _DOTENV_VAL
 
     # Now the env var takes ultimate precedence
     with mock.patch.dict(os.environ, {"COMPONENT_NAME": _ENV_VAL}):
@@ -1360,7 +1331,6 @@ def test_override_with_command_line_args():
     assert CONFIG.COMPONENT_NAME == "USAspending API"
     test_args = ["dummy_program", "--config", "COMPONENT_NAME=test_override_with_command_line_args"]
     with patch.object(sys, "argv", test_args):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         app_cfg_copy = _load_config()
         assert app_cfg_copy.COMPONENT_NAME == "test_override_with_command_line_args"
     # Ensure the official CONFIG is unchanged
@@ -1376,7 +1346,6 @@ def test_override_multiple_with_command_line_args():
         "COMPONENT_NAME=test_override_multiple_with_command_line_args AWS_REGION=a-new-region",
     ]
     with patch.object(sys, "argv", test_args):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         app_cfg_copy = _load_config()
         assert app_cfg_copy.COMPONENT_NAME == "test_override_multiple_with_command_line_args"
         assert app_cfg_copy.AWS_REGION == "a-new-region"
@@ -1385,7 +1354,25 @@ def test_override_multiple_with_command_line_args():
     assert CONFIG.AWS_REGION == original_aws_region
 
 
-def test_precedence_order(tmpdir):
+def test_load_config_cached_on_inputs():
+    """Ensure _load_config reuses a loaded config for unchanged inputs and reloads when argv or env vars change,
+    without needing to clear the cache"""
+    first_cfg = _load_config()
+    assert _load_config() is first_cfg
+
+    test_args = ["dummy_program", "--config", "COMPONENT_NAME=test_load_config_cached_on_inputs"]
+    with patch.object(sys, "argv", test_args):
+        app_cfg_copy = _load_config()
+        assert app_cfg_copy.COMPONENT_NAME == "test_load_config_cached_on_inputs"
+
+    with mock.patch.dict(os.environ, {"COMPONENT_NAME": "test_load_config_cached_on_inputs_env"}):
+        app_cfg_copy = _load_config()
+        assert app_cfg_copy.COMPONENT_NAME == "test_load_config_cached_on_inputs_env"
+
+    assert _load_config() is first_cfg
+
+
+def test_precedence_order(component_name_dotenv_path):
     """Confirm all overrides happen in the expected order
 
     1. Default value set in DefaultConfig
@@ -1397,22 +1384,11 @@ def test_precedence_order(tmpdir):
 
     """
     # Verify default if nothing overriding
-    cfg = LocalConfig()
-    assert cfg.COMPONENT_NAME == "USAspending API"
-    dotenv_val = "a_test_verifying_dotenv_overrides_runtime_env_default_config"
+    assert _DEFAULT_LOCAL_CFG.COMPONENT_NAME == "USAspending API"
 
     # Now the .env file takes precedence
-    tmp_config_dir = tmpdir.mkdir("config_dir")
-    dotenv_file = tmp_config_dir.join(".env")
-    # Must use some of the default overrides from .env, like USASPENDING_DB_*. Fallback to .env.template if not existing
-    shutil.copy(str(_PROJECT_ROOT_DIR / ".env.template"), dotenv_file)
-    if Path(_PROJECT_ROOT_DIR / ".env").exists():
-        shutil.copy(str(_PROJECT_ROOT_DIR / ".env"), dotenv_file)
-    with open(dotenv_file, "a"):
-        dotenv_file.write(f"COMPONENT_NAME={dotenv_val}", "a")
-    dotenv_path = os.path.join(dotenv_file.dirname, dotenv_file.basename)
-    cfg = LocalConfig(_env_file=dotenv_path)
-    assert cfg.COMPONENT_NAME == dotenv_val
+    cfg = LocalConfig(_env_file=component_name_dotenv_path)
+    assert cfg.COMPONENT_NAME == _DOTENV_VAL
 
     # Now the env var, when present, takes precedence
     with mock.patch.dict(os.environ, {"COMPONENT_NAME": _ENV_VAL}):
@@ -1430,19 +1406,13 @@ def test_precedence_order(tmpdir):
     test_args = ["dummy_program", "--config", f"COMPONENT_NAME={cli_val}"]
     with mock.patch.dict(os.environ, {"COMPONENT_NAME": _ENV_VAL}):
         with patch.object(sys, "argv", test_args):
-            _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
             app_cfg_copy = _load_config()
             assert app_cfg_copy.COMPONENT_NAME == cli_val
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_new_runtime_env_config():
     """Test that envs with their own subclass of DefaultConfig work as expected"""
     with mock.patch.dict(os.environ, {ENV_CODE_VAR: _UnitTestBaseConfig.ENV_CODE}):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
         assert cfg.UNITTEST_CFG_A == "UNITTEST_CFG_A"
         assert cfg.UNITTEST_CFG_B == "UNITTEST_CFG_B"
@@ -1454,10 +1424,6 @@ def test_new_runtime_env_config():
         assert cfg.UNITTEST_CFG_AJ == "UNITTEST_CFG_AE" + ":" + "UNITTEST_CFG_AF"
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_new_runtime_env_overrides_config():
     """Test that multiple levels of subclasses of DefaultConfig override their parents' config.
     Cases documented inline"""
@@ -1467,7 +1433,6 @@ def test_new_runtime_env_overrides_config():
             ENV_CODE_VAR: _UnitTestSubConfig.ENV_CODE,
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. Config vars like COMPONENT_NAME still override even if originally defined at the grandparent config level
@@ -1517,10 +1482,6 @@ def test_new_runtime_env_overrides_config():
         assert cfg.UNITTEST_CFG_AK == "SUB_UNITTEST_6" + ":" + "SUB_UNITTEST_7"
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_new_runtime_env_overrides_config_errors_subclass_only_validated_fields():
     """Test that a KeyError is raised if a validator in the subclass for a field in the parent class tries to
     compose fields it its factory function that are only present in the subclass, in this case, when the validator
@@ -1534,16 +1495,11 @@ def test_new_runtime_env_overrides_config_errors_subclass_only_validated_fields(
         },
     ):
         with pytest.raises(KeyError) as exc_info:
-            _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
             _load_config()
 
         assert "SUB_UNITTEST_6" in str(exc_info.value)
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_new_runtime_env_overrides_config_errors_subclass_only_validated_fields_override():
     """Test that a KeyError is raised if a validator in the subclass for a field in the parent class tries to
     compose fields it its factory function that are only present in the subclass, in this case, when the validator
@@ -1557,16 +1513,11 @@ def test_new_runtime_env_overrides_config_errors_subclass_only_validated_fields_
         },
     ):
         with pytest.raises(KeyError) as exc_info:
-            _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
             _load_config()
 
         assert "SUB_UNITTEST_6" in str(exc_info.value)
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_new_runtime_env_overrides_config_errors_root_validator_overriding_validator():
     """Test that a ValidationError is raised if a validator in the parent class is overridden by a root_validator in
     the child class
@@ -1578,16 +1529,11 @@ def test_new_runtime_env_overrides_config_errors_root_validator_overriding_valid
         },
     ):
         with pytest.raises(ValidationError) as exc_info:
-            _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
             _load_config()
 
         assert "root_validators cannot override validators" in str(exc_info.value)
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_new_runtime_env_overrides_config_with_env_vars_in_play():
     """Test that multiple levels of subclasses of DefaultConfig override their parents' config AND the way that
     environment variables replace default config var value, even when overriding among classes, is as expected. Cases
@@ -1610,7 +1556,6 @@ def test_new_runtime_env_overrides_config_with_env_vars_in_play():
             "UNITTEST_CFG_AM": "ENVVAR_UNITTEST_CFG_AM",
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. Env var is overrides field in base, and inherited by child even if not declared/overridden in child
@@ -1675,10 +1620,6 @@ def test_new_runtime_env_overrides_config_with_env_vars_in_play():
         assert cfg.UNITTEST_CFG_AM == "UNITTEST_CFG_AE:UNITTEST_CFG_AF"
 
 
-@mock.patch(
-    "usaspending_api.config.ENVS",  # Recall, it needs to be patched where imported, not where it lives
-    _UNITTEST_ENVS_DICTS,
-)
 def test_new_runtime_env_overrides_config_with_env_vars_in_play_and_subclasses():
     """Test that multiple levels of subclasses of DefaultConfig override their parents' config AND the way that
     environment variables replace default config var value, even when overriding among classes, is as expected. Cases
@@ -1695,7 +1636,6 @@ def test_new_runtime_env_overrides_config_with_env_vars_in_play_and_subclasses()
             "SUB_UNITTEST_4": "ENVVAR_SUB_UNITTEST_4",
         },
     ):
-        _load_config.cache_clear()  # wipes the @lru_cache for fresh run on next call
         cfg = _load_config()
 
         # 1. Env var takes priority over Config vars like COMPONENT_NAME still override even if originally defined at the
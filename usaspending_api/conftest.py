@@ -5,6 +5,7 @@ import pytest
 import tempfile
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.management import call_command
 from django.db import connections
 from django.test import override_settings
@@ -13,6 +14,7 @@ from pathlib import Path
 
 from usaspending_api.config import CONFIG
 from usaspending_api.common.helpers.sql_helpers import execute_sql_simple
+from usaspending_api.accounts.v2.filters.account_download import _get_toptier_agency_id
 from usaspending_api.common.elasticsearch.elasticsearch_sql_helpers import (
     ensure_view_exists,
     ensure_business_categories_functions_exist,
@@ -385,6 +387,14 @@ def broker_server_dblink_setup(django_db_blocker, broker_db_setup):
         ensure_broker_server_dblink_exists()
 
 
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Data cached for the life of the process must not leak from one test's data into the next"""
+    cache.clear()
+    _get_toptier_agency_id.cache_clear()
+    yield
+
+
 @pytest.fixture
 def temp_file_path():
     """
@@ -1,4 +1,4 @@
-from django.db.models import OuterRef, Q, Exists
+from django.db.models import Count
 from rest_framework.request import Request
 from rest_framework.response import Response
 
@@ -15,19 +15,21 @@ class ObjectClassCountViewSet(DisasterBase):
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/disaster/object_class/count.md"
 
+    # The count only depends on the DEFC filter; ignore any other keys in the payload when building the cache key
+    cache_key_whitelist = ["filter"]
+
     @cache_response()
     def post(self, request: Request) -> Response:
         filters = [
-            Q(object_class_id=OuterRef("pk")),
             self.all_closed_defc_submissions,
             self.is_in_provided_def_codes,
             self.is_non_zero_total_spending,
         ]
-        count = (
-            ObjectClass.objects.filter(Exists(FinancialAccountsByProgramActivityObjectClass.objects.filter(*filters)))
-            .values("object_class")
-            .distinct()
-            .count()
+        object_class_ids = FinancialAccountsByProgramActivityObjectClass.objects.filter(*filters).values(
+            "object_class_id"
         )
+        count = ObjectClass.objects.filter(id__in=object_class_ids).aggregate(
+            count=Count("object_class", distinct=True)
+        )["count"]
 
         return Response({"count": count})
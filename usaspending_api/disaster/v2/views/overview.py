@@ -40,7 +40,6 @@ class OverviewViewSet(DisasterBase):
         )
 
     def _parse_and_validate(self, request):
-        all_def_codes = sorted(list(DisasterEmergencyFundCode.objects.values_list("code", flat=True)))
         models = [
             {
                 "key": "def_codes",
@@ -49,10 +48,14 @@ class OverviewViewSet(DisasterBase):
                 "text_type": "search",
                 "allow_nulls": True,
                 "optional": True,
-                "default": ",".join(all_def_codes),
             },
         ]
-        return TinyShield(models).block(request)
+        request_values = TinyShield(models).block(request)
+        if "def_codes" not in request_values:
+            # Only build the default list of all DEF Codes when the request did not provide any
+            all_def_codes = sorted(DisasterEmergencyFundCode.objects.values_list("code", flat=True))
+            request_values["def_codes"] = ",".join(all_def_codes)
+        return request_values
 
     def funding(self):
         funding = list(
@@ -43,6 +43,8 @@ MAX_VISIBILITY_TIMEOUT = 60 * 60 * settings.DOWNLOAD_DB_TIMEOUT_IN_HOURS
 EXCEL_ROW_LIMIT = 1000000
 WAIT_FOR_PROCESS_SLEEP = 5
 JOB_TYPE = "USAspendingDownloader"
+PROCUREMENT_TYPE_CODES = frozenset(contract_type_mapping) | frozenset(idv_type_mapping)
+ASSISTANCE_TYPE_CODES = frozenset(assistance_type_mapping)
 
 logger = logging.getLogger(__name__)
 
@@ -202,10 +204,7 @@ def get_download_sources(json_request: dict, download_job: DownloadJob = None, o
             else:
                 award_type_codes = set(filters["award_type_codes"])
 
-            if (
-                award_type_codes & (set(contract_type_mapping.keys()) | set(idv_type_mapping.keys()))
-                or "procurement" in award_type_codes
-            ):
+            if award_type_codes & PROCUREMENT_TYPE_CODES or "procurement" in award_type_codes:
                 # only generate d1 files if the user is asking for contract data
                 d1_source = DownloadSource(
                     VALUE_MAPPINGS[download_type]["table_name"], "d1", download_type, agency_id, filters
@@ -214,7 +213,7 @@ def get_download_sources(json_request: dict, download_job: DownloadJob = None, o
                 d1_source.queryset = queryset & download_type_table.objects.filter(**d1_filters)
                 download_sources.append(d1_source)
 
-            if award_type_codes & set(assistance_type_mapping.keys()) or ("grant" in award_type_codes):
+            if award_type_codes & ASSISTANCE_TYPE_CODES or ("grant" in award_type_codes):
                 # only generate d2 files if the user is asking for assistance data
                 d2_source = DownloadSource(
                     VALUE_MAPPINGS[download_type]["table_name"], "d2", download_type, agency_id, filters
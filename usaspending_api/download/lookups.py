@@ -20,8 +20,8 @@ from usaspending_api.download.models import (
     AppropriationAccountBalancesDownloadView,
     FinancialAccountsByAwardsDownloadView,
     FinancialAccountsByProgramActivityObjectClassDownloadView,
+    GTASSF133BalancesDownloadView,
 )
-from usaspending_api.references.models import GTASSF133Balances
 from usaspending_api.search.models import AwardSearch, SubawardSearch, TransactionSearch
 from usaspending_api.awards.v2.filters.idv_filters import (
     idv_order_filter,
@@ -122,7 +122,7 @@ VALUE_MAPPINGS = {
     },
     "gtas_balances": {
         "source_type": "account",
-        "table": GTASSF133Balances,
+        "table": GTASSF133BalancesDownloadView,
         "table_name": "gtas_balances",
         "download_name": "{data_quarters}_{agency}_{level}_AccountBalances_{timestamp}",
         "zipfile_template": "{data_quarters}_{agency}_{level}_AccountBalances_{timestamp}",
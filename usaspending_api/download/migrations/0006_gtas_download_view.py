@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # These dependencies need to correspond to the most up-to-date fields needed by the Download Views
+    # otherwise columns could be missing from the views; this will mostly be noticeable with pytest
+    dependencies = [
+        ("accounts", "0006_tas_rendering_label_index"),
+        ("download", "0005_downloadjoblookup"),
+        ("references", "0060_gtassf133balances_adjustments_to_unobligated_balance_brought_forward_cpe"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GTASSF133BalancesDownloadView",
+            fields=[],
+            options={
+                "db_table": "vw_gtas_sf133_balances_download",
+                "managed": False
+            }
+        ),
+        migrations.RunSQL(
+            sql=[f"{Path('usaspending_api/download/sql/vw_gtas_sf133_balances_download.sql').read_text()}"],
+            reverse_sql=["DROP VIEW IF EXISTS vw_gtas_sf133_balances_download;"],
+        ),
+    ]
@@ -6,11 +6,13 @@ from usaspending_api.download.models.download_job import DownloadJob, JobStatus
 from usaspending_api.download.models.financial_accounts_by_program_activity_object_class_download import (
     FinancialAccountsByProgramActivityObjectClassDownloadView,
 )
+from usaspending_api.download.models.gtas_sf133_balances_download import GTASSF133BalancesDownloadView
 
 __all__ = [
     "AppropriationAccountBalancesDownloadView",
     "DownloadJob",
     "FinancialAccountsByAwardsDownloadView",
     "FinancialAccountsByProgramActivityObjectClassDownloadView",
+    "GTASSF133BalancesDownloadView",
     "JobStatus",
 ]
@@ -0,0 +1,30 @@
+from django.db import models
+
+from usaspending_api.references.models.gtas_sf133_balances import AbstractGTASSF133Balances
+
+
+class GTASSF133BalancesDownloadView(AbstractGTASSF133Balances):
+    """
+    Model based on a View to support GTAS balance downloads. Inherits the GTAS table's model to ensure that all
+    necessary fields are in place to support previous download functionality while also adding additional fields
+    that are either:
+        * not easily queried through the Django ORM
+        * need to be manually defined in the query for performance
+    """
+
+    # Overriding attributes from the Abstract Fields;
+    # This needs to occur primarily for the values of "on_delete" and "related_name"
+    treasury_account_identifier = models.ForeignKey(
+        "accounts.TreasuryAppropriationAccount",
+        models.DO_NOTHING,
+        null=True,
+        db_column="treasury_account_identifier",
+    )
+
+    # Additional values from the View
+    agency_identifier_name = models.TextField()
+    allocation_transfer_agency_identifier_name = models.TextField()
+
+    class Meta:
+        db_table = "vw_gtas_sf133_balances_download"
+        managed = False
@@ -0,0 +1,30 @@
+-- The agency code derivations joined on below must match agency_identifier_code and
+-- allocation_transfer_agency_identifier_code in gtas_balances_derivations (accounts/v2/filters/account_download.py)
+DROP VIEW IF EXISTS vw_gtas_sf133_balances_download;
+CREATE VIEW vw_gtas_sf133_balances_download AS
+SELECT
+    GTAS.*,
+	CGAC_AID.agency_name AS agency_identifier_name,
+	CGAC_ATA.agency_name AS allocation_transfer_agency_identifier_name
+FROM gtas_sf133_balances AS GTAS
+LEFT OUTER JOIN treasury_appropriation_account AS TAA USING (treasury_account_identifier)
+LEFT OUTER JOIN cgac AS CGAC_AID ON (
+    COALESCE(
+        TAA.agency_id,
+        CASE
+            WHEN ARRAY_UPPER(STRING_TO_ARRAY(GTAS.tas_rendering_label, '-'), 1) = 5
+            THEN SPLIT_PART(GTAS.tas_rendering_label, '-', 2)
+            ELSE SPLIT_PART(GTAS.tas_rendering_label, '-', 1)
+        END
+    ) = CGAC_AID.cgac_code
+)
+LEFT OUTER JOIN cgac AS CGAC_ATA ON (
+    COALESCE(
+        TAA.allocation_transfer_agency_id,
+        CASE
+            WHEN ARRAY_UPPER(STRING_TO_ARRAY(GTAS.tas_rendering_label, '-'), 1) = 5
+            THEN SPLIT_PART(GTAS.tas_rendering_label, '-', 1)
+        END
+    ) = CGAC_ATA.cgac_code
+)
+;
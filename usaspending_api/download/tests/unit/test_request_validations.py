@@ -0,0 +1,52 @@
+import pytest
+
+from model_bakery import baker
+
+from usaspending_api.common.exceptions import InvalidParameterException
+from usaspending_api.download.v2.request_validations import (
+    _fast_json_copy,
+    _get_toptier_agency_name,
+    _validate_award_id,
+)
+
+
+def test_fast_json_copy():
+    original = {
+        "filters": {"def_codes": ["L", "M"], "agency": "all", "fy": 2021},
+        "columns": ("recipient", "award_obligations"),
+        "include_data_dictionary": True,
+        "limit": None,
+    }
+    copied = _fast_json_copy(original)
+
+    assert copied == original
+    assert copied is not original
+    assert copied["filters"] is not original["filters"]
+    assert copied["filters"]["def_codes"] is not original["filters"]["def_codes"]
+
+    copied["filters"]["def_codes"].append("N")
+    copied["filters"]["agency"] = "012"
+    assert original["filters"] == {"def_codes": ["L", "M"], "agency": "all", "fy": 2021}
+
+
+@pytest.mark.django_db
+def test_get_toptier_agency_name_falls_back_on_cache_miss():
+    baker.make("references.ToptierAgency", toptier_agency_id=1, name="Agency One")
+    assert _get_toptier_agency_name(1) == "Agency One"
+    assert _get_toptier_agency_name(2) is None
+
+    # Loaded after the names were cached, as happens when agencies are reloaded by another process
+    baker.make("references.ToptierAgency", toptier_agency_id=2, name="Agency Two")
+    assert _get_toptier_agency_name(2) == "Agency Two"
+    assert _get_toptier_agency_name(1) == "Agency One"
+
+
+@pytest.mark.django_db
+def test_validate_award_id_caches_only_found_awards():
+    with pytest.raises(InvalidParameterException):
+        _validate_award_id("CONT_AWD_1", ("id", "piid"))
+
+    baker.make("awards.Award", id=1, generated_unique_award_id="CONT_AWD_1", piid="PIID1")
+    assert _validate_award_id("CONT_AWD_1", ("id", "piid")) == (1, "PIID1")
+    assert _validate_award_id(1, ("id", "piid")) == (1, "PIID1")
+    assert _validate_award_id("1", ("id", "generated_unique_award_id")) == (1, "CONT_AWD_1")
@@ -1585,11 +1585,8 @@ query_paths = {
                 ("sub_account_code", "sub_account_code"),  # Column is annotated in account_download.py
                 ("treasury_account_symbol", "tas_rendering_label"),
                 ("treasury_account_name", "treasury_account_identifier__account_title"),
-                ("agency_identifier_name", "agency_identifier_name"),  # Column is annotated in account_download.py
-                (
-                    "allocation_transfer_agency_identifier_name",
-                    "allocation_transfer_agency_identifier_name",
-                ),  # Column is annotated in account_download.py
+                ("agency_identifier_name", "agency_identifier_name"),
+                ("allocation_transfer_agency_identifier_name", "allocation_transfer_agency_identifier_name"),
                 ("budget_function", "treasury_account_identifier__budget_function_title"),
                 ("budget_subfunction", "treasury_account_identifier__budget_subfunction_title"),
                 ("federal_account_symbol", "treasury_account_identifier__federal_account__federal_account_code"),
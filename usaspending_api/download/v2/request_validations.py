@@ -1,8 +1,8 @@
 import json
-from copy import deepcopy
 from datetime import datetime, MINYEAR, MAXYEAR
 from django.conf import settings
-from typing import Optional
+from django.core.cache import cache
+from typing import Optional, Tuple
 
 from usaspending_api.awards.models import Award
 from usaspending_api.awards.v2.lookups.lookups import (
@@ -29,6 +29,49 @@ from usaspending_api.submissions import helpers as sub_helpers
 from usaspending_api.submissions.helpers import get_last_closed_submission_date
 
 
+# The award type mappings are static lookups, so the sets and tuples derived from them are built once at import
+_CONTRACT_TYPE_SET = frozenset(contract_type_mapping)
+_IDV_TYPE_SET = frozenset(idv_type_mapping)
+_GRANT_TYPE_SET = frozenset(grant_type_mapping)
+_LOAN_TYPE_SET = frozenset(loan_type_mapping)
+_DIRECT_PAYMENT_TYPE_SET = frozenset(direct_payment_type_mapping)
+_OTHER_TYPE_SET = frozenset(other_type_mapping)
+_ALL_AWARD_TYPE_SET = frozenset(award_type_mapping)
+
+# Checked in order; the first bucket containing every requested award type code names the download
+_AWARD_CATEGORY_BUCKETS = (
+    ("Contracts", _CONTRACT_TYPE_SET),
+    ("Contract-IDVs", _IDV_TYPE_SET),
+    ("Grants", _GRANT_TYPE_SET),
+    ("Loans", _LOAN_TYPE_SET),
+    ("Direct-Payments", _DIRECT_PAYMENT_TYPE_SET),
+    ("Other-Financial-Assistance", _OTHER_TYPE_SET),
+)
+
+_CONTRACT_TYPE_TUPLE = tuple(contract_type_mapping)
+_CONTRACT_AND_IDV_TYPE_TUPLE = tuple(_CONTRACT_TYPE_SET | _IDV_TYPE_SET)
+_ASSISTANCE_TYPE_TUPLE = tuple(assistance_type_mapping)
+
+_VALID_ACCOUNT_SUBMISSION_TYPE_SET = frozenset(VALID_ACCOUNT_SUBMISSION_TYPES)
+
+# A year constrained download with exactly these filters is a keyword search download
+_KEYWORD_SEARCH_FILTER_KEYS = frozenset(("award_type_codes", "keywords"))
+
+# Custom award download filters copied as-is, in the same order as their TinyShield models
+_PASSTHROUGH_CUSTOM_AWARD_FILTER_KEYS = (
+    "place_of_performance_locations",
+    "place_of_performance_scope",
+    "recipient_locations",
+    "recipient_scope",
+)
+
+# Seconds to hold reference data (DEF Codes, Toptier Agencies) that is reloaded outside of the API process
+_REFERENCE_DATA_CACHE_TIMEOUT = 300
+
+# Seconds to hold the identifiers of a downloaded award, which are reloaded outside of the API process
+_AWARD_IDENTIFIERS_CACHE_TIMEOUT = 60
+
+
 class DownloadValidatorBase:
     name: str
 
@@ -65,12 +108,11 @@ class DownloadValidatorBase:
         return validated_request
 
     def set_filter_defaults(self, defaults: dict):
-        for key, val in defaults.items():
-            self._json_request["filters"].setdefault(key, val)
+        self._json_request["filters"] = {**defaults, **self._json_request["filters"]}
 
     @property
     def json_request(self):
-        return deepcopy(self._json_request)
+        return _fast_json_copy(self._json_request)
 
 
 class AwardDownloadValidator(DownloadValidatorBase):
@@ -81,10 +123,10 @@ class AwardDownloadValidator(DownloadValidatorBase):
         self.request_data = request_data
         self._json_request["download_types"] = self.request_data.get("award_levels")
         self._json_request["filters"] = _validate_filters_exist(request_data)
-        self.set_filter_defaults({"award_type_codes": list(award_type_mapping.keys())})
+        self.set_filter_defaults({"award_type_codes": list(award_type_mapping)})
 
         constraint_type = self.request_data.get("constraint_type")
-        if constraint_type == "year" and sorted(self._json_request["filters"]) == ["award_type_codes", "keywords"]:
+        if constraint_type == "year" and self._json_request["filters"].keys() == _KEYWORD_SEARCH_FILTER_KEYS:
             self._handle_keyword_search_download()
         elif constraint_type == "year":
             self._handle_custom_award_download()
@@ -147,7 +189,8 @@ class AwardDownloadValidator(DownloadValidatorBase):
                     "optional": False,
                     "object_keys": {
                         "start_date": {"type": "date", "default": "1000-01-01"},
-                        "end_date": {"type": "date", "default": datetime.strftime(datetime.utcnow(), "%Y-%m-%d")},
+                        # Defaults to the current date once the request has been validated
+                        "end_date": {"type": "date"},
                     },
                 },
                 {
@@ -183,7 +226,7 @@ class AwardDownloadValidator(DownloadValidatorBase):
                     "type": "array",
                     "array_type": "enum",
                     "min": 0,
-                    "enum_values": list(award_type_mapping.keys()),
+                    "enum_values": list(award_type_mapping),
                 },
                 {
                     "name": "recipient_locations",
@@ -224,17 +267,13 @@ class AwardDownloadValidator(DownloadValidatorBase):
 
         self._json_request = self.get_validated_request()
         custom_award_filters = self._json_request["filters"]
+        custom_award_filters["date_range"].setdefault("end_date", datetime.utcnow().strftime("%Y-%m-%d"))
         final_award_filters = {}
 
         # These filters do not need any normalization
-        for key, value in custom_award_filters.items():
-            if key in [
-                "recipient_locations",
-                "recipient_scope",
-                "place_of_performance_locations",
-                "place_of_performance_scope",
-            ]:
-                final_award_filters[key] = value
+        for key in _PASSTHROUGH_CUSTOM_AWARD_FILTER_KEYS:
+            if key in custom_award_filters:
+                final_award_filters[key] = custom_award_filters[key]
 
         if get_date_range_length(custom_award_filters["date_range"]) > 366:
             raise InvalidParameterException("Invalid Parameter: date_range total days must be within a year")
@@ -269,14 +308,9 @@ class AwardDownloadValidator(DownloadValidatorBase):
             if filter_all_agencies:
                 toptier_name = "all"
             else:
-                toptier_name = (
-                    ToptierAgency.objects.filter(toptier_agency_id=custom_award_filters["agency"])
-                    .values("name")
-                    .first()
-                )
+                toptier_name = _get_toptier_agency_name(custom_award_filters["agency"])
                 if toptier_name is None:
                     raise InvalidParameterException(f"Toptier ID not found: {custom_award_filters['agency']}")
-                toptier_name = toptier_name["name"]
 
             if "sub_agency" in custom_award_filters:
                 final_award_filters["agencies"].append(
@@ -291,9 +325,11 @@ class AwardDownloadValidator(DownloadValidatorBase):
                 final_award_filters["agencies"].append({"type": "awarding", "tier": "toptier", "name": toptier_name})
 
         if "agencies" in custom_award_filters:
-            final_award_filters["agencies"] = [
-                val for val in custom_award_filters["agencies"] if val.get("name", "").lower() != "all"
-            ]
+            agencies = custom_award_filters["agencies"]
+            # "all" agencies are rare, so only build a filtered list when one is present
+            if any(val.get("name", "").lower() == "all" for val in agencies):
+                agencies = [val for val in agencies if val.get("name", "").lower() != "all"]
+            final_award_filters["agencies"] = agencies
 
         self._json_request["filters"] = final_award_filters
 
@@ -349,10 +385,10 @@ class IdvDownloadValidator(DownloadValidatorBase):
         )
         self._json_request = request_data
         self._json_request = self.get_validated_request()
-        award_id, piid, _, _, _ = _validate_award_id(self._json_request.pop("award_id"))
+        award_id, piid = _validate_award_id(self._json_request.pop("award_id"), ("id", "piid"))
         filters = {
             "idv_award_id": award_id,
-            "award_type_codes": tuple(set(contract_type_mapping) | set(idv_type_mapping)),
+            "award_type_codes": _CONTRACT_AND_IDV_TYPE_TUPLE,
         }
         self._json_request.update(
             {
@@ -397,10 +433,10 @@ class ContractDownloadValidator(DownloadValidatorBase):
         )
         self._json_request = request_data
         self._json_request = self.get_validated_request()
-        award_id, piid, _, _, _ = _validate_award_id(self._json_request.pop("award_id"))
+        award_id, piid = _validate_award_id(self._json_request.pop("award_id"), ("id", "piid"))
         filters = {
             "award_id": award_id,
-            "award_type_codes": tuple(set(contract_type_mapping)),
+            "award_type_codes": _CONTRACT_TYPE_TUPLE,
         }
         self._json_request.update(
             {
@@ -448,10 +484,12 @@ class AssistanceDownloadValidator(DownloadValidatorBase):
         )
         self._json_request = request_data
         self._json_request = self.get_validated_request()
-        award_id, _, fain, uri, generated_unique_award_id = _validate_award_id(self._json_request.pop("award_id"))
+        award_id, fain, uri, generated_unique_award_id = _validate_award_id(
+            self._json_request.pop("award_id"), ("id", "fain", "uri", "generated_unique_award_id")
+        )
         filters = {
             "award_id": award_id,
-            "award_type_codes": tuple(set(assistance_type_mapping)),
+            "award_type_codes": _ASSISTANCE_TYPE_TUPLE,
         }
         award = fain
         if "AGG" in generated_unique_award_id:
@@ -488,7 +526,7 @@ class DisasterRecipientDownloadValidator(DownloadValidatorBase):
                     "name": "def_codes",
                     "type": "array",
                     "array_type": "enum",
-                    "enum_values": sorted(DisasterEmergencyFundCode.objects.values_list("code", flat=True)),
+                    "enum_values": _get_def_codes(),
                     "allow_nulls": False,
                     "optional": False,
                 },
@@ -505,7 +543,7 @@ class DisasterRecipientDownloadValidator(DownloadValidatorBase):
                     "name": "award_type_codes",
                     "type": "array",
                     "array_type": "enum",
-                    "enum_values": sorted(award_type_mapping.keys()),
+                    "enum_values": sorted(award_type_mapping),
                     "allow_nulls": False,
                     "optional": True,
                 },
@@ -518,30 +556,27 @@ class DisasterRecipientDownloadValidator(DownloadValidatorBase):
         # Determine what to use in the filename based on "award_type_codes" filter;
         # Also add "face_value_of_loans" column if only loan types
         award_category = "All-Awards"
-        award_type_codes = set(self._json_request["filters"].get("award_type_codes", award_type_mapping.keys()))
+        award_type_codes = frozenset(self._json_request["filters"].get("award_type_codes", _ALL_AWARD_TYPE_SET))
         columns = ["recipient", "award_obligations", "award_outlays", "number_of_awards"]
 
-        if award_type_codes <= set(contract_type_mapping.keys()):
-            award_category = "Contracts"
-        elif award_type_codes <= set(idv_type_mapping.keys()):
-            award_category = "Contract-IDVs"
-        elif award_type_codes <= set(grant_type_mapping.keys()):
-            award_category = "Grants"
-        elif award_type_codes <= set(loan_type_mapping.keys()):
-            award_category = "Loans"
+        for category, category_type_codes in _AWARD_CATEGORY_BUCKETS:
+            if award_type_codes <= category_type_codes:
+                award_category = category
+                break
+
+        if award_category == "Loans":
             columns.insert(3, "face_value_of_loans")
-        elif award_type_codes <= set(direct_payment_type_mapping.keys()):
-            award_category = "Direct-Payments"
-        elif award_type_codes <= set(other_type_mapping.keys()):
-            award_category = "Other-Financial-Assistance"
 
         self._json_request["award_category"] = award_category
         self._json_request["columns"] = self._json_request.get("columns") or tuple(columns)
 
         # Need to specify the field to use "query" filter on if present
-        query_text = self._json_request["filters"].pop("query", None)
+        filters = self._json_request["filters"]
+        query_text = filters.get("query")
         if query_text:
-            self._json_request["filters"]["query"] = {"text": query_text, "fields": ["recipient_name"]}
+            filters["query"] = {"text": query_text, "fields": ["recipient_name"]}
+        elif "query" in filters:
+            del filters["query"]
 
 
 class AccountDownloadValidator(DownloadValidatorBase):
@@ -587,7 +622,7 @@ class AccountDownloadValidator(DownloadValidatorBase):
                     "key": "filters|def_codes",
                     "type": "array",
                     "array_type": "enum",
-                    "enum_values": sorted(DisasterEmergencyFundCode.objects.values_list("code", flat=True)),
+                    "enum_values": _get_def_codes(),
                 },
                 {
                     "name": "federal_account",
@@ -701,25 +736,78 @@ class DisasterDownloadValidator(DownloadValidatorBase):
         )
 
 
-def _validate_award_id(award_id):
+def _fast_json_copy(obj):
+    """
+    Copy the dicts and lists of a validated request. The leaves of a validated request are immutable JSON primitives
+    (or tuples of them) so they can be shared, which avoids the overhead of deepcopy's generic memo handling.
+    """
+    if type(obj) is dict:
+        return {k: _fast_json_copy(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [_fast_json_copy(v) for v in obj]
+    return obj
+
+
+def _get_def_codes() -> Tuple[str, ...]:
+    """DEF Codes are reloaded out of process, so only hold them for a few minutes instead of querying every request"""
+    return cache.get_or_set(
+        "download_def_codes",
+        lambda: tuple(sorted(DisasterEmergencyFundCode.objects.values_list("code", flat=True))),
+        timeout=_REFERENCE_DATA_CACHE_TIMEOUT,
+    )
+
+
+def _get_toptier_agency_name(toptier_agency_id: int) -> Optional[str]:
+    """
+    Toptier Agencies are reloaded out of process, so hold their names for a few minutes instead of querying every
+    request. An agency missing from the cached names is looked up directly, and added if it now exists.
+    """
+    names = cache.get_or_set(
+        "download_toptier_agency_names",
+        lambda: dict(ToptierAgency.objects.values_list("toptier_agency_id", "name")),
+        timeout=_REFERENCE_DATA_CACHE_TIMEOUT,
+    )
+    if toptier_agency_id not in names:
+        name = ToptierAgency.objects.filter(toptier_agency_id=toptier_agency_id).values_list("name", flat=True).first()
+        if name is None:
+            return None
+        names[toptier_agency_id] = name
+        cache.set("download_toptier_agency_names", names, timeout=_REFERENCE_DATA_CACHE_TIMEOUT)
+    return names[toptier_agency_id]
+
+
+def _validate_award_id(award_id, fields: Tuple[str, ...]) -> tuple:
+    """Return the requested Award fields, in order, for an Award id or generated_unique_award_id"""
     if type(award_id) is int or award_id.isdigit():
-        filters = {"id": int(award_id)}
-    else:
-        filters = {"generated_unique_award_id": award_id}
+        return _get_award_identifiers("id", int(award_id), fields)
+    return _get_award_identifiers("generated_unique_award_id", award_id, fields)
+
+
+def _get_award_identifiers(field: str, value, fields: Tuple[str, ...]) -> tuple:
+    """
+    Popular awards are downloaded repeatedly, so found awards are held briefly instead of querying every request;
+    an award reloaded or deleted outside of the API process is picked up once its entry expires. Unknown award ids
+    raise and are therefore never cached.
+    """
+
+    def _get_award():
+        award = Award.objects.filter(**{field: value}).values_list(*fields).first()
+        if not award:
+            raise InvalidParameterException("Unable to find award matching the provided award id")
+        return award
 
-    award = (
-        Award.objects.filter(**filters).values_list("id", "piid", "fain", "uri", "generated_unique_award_id").first()
+    return cache.get_or_set(
+        f"download_award_identifiers:{field}:{value}:{','.join(fields)}",
+        _get_award,
+        timeout=_AWARD_IDENTIFIERS_CACHE_TIMEOUT,
     )
-    if not award:
-        raise InvalidParameterException("Unable to find award matching the provided award id")
-    return award
 
 
 def _validate_filters_exist(request_data):
     filters = request_data.get("filters")
     if not isinstance(filters, dict):
         raise InvalidParameterException("Filters parameter not provided as a dict")
-    elif len(filters) == 0:
+    if not filters:
         raise InvalidParameterException("At least one filter is required.")
     return filters
 
@@ -785,8 +873,9 @@ def _validate_submission_type(filters: dict) -> None:
         msg = f"Provide at least one value in submission_types: {' '.join(VALID_ACCOUNT_SUBMISSION_TYPES)}"
         raise InvalidParameterException(msg)
 
-    if any(True for submission_type in submission_types if submission_type not in VALID_ACCOUNT_SUBMISSION_TYPES):
+    if not all(submission_type in _VALID_ACCOUNT_SUBMISSION_TYPE_SET for submission_type in submission_types):
         msg = f"Invalid value in submission_types. Options: [{', '.join(VALID_ACCOUNT_SUBMISSION_TYPES)}]"
         raise InvalidParameterException(msg)
 
-    filters["submission_types"] = list(set(submission_types))
+    # Deduplicate while keeping the requested order
+    filters["submission_types"] = list(dict.fromkeys(submission_types))
@@ -43,37 +43,56 @@ class Command(BaseCommand):
         #       OR remove entirely and update the award_search generation script/pipeline to perform after
         #       subaward_search is updated and use that
         award_table = "raw.awards"
-        update_award_query = f"""
-            WITH subaward_totals AS (
-                SELECT
-                    award_id,
-                    SUM(COALESCE(subaward_amount, 0)) AS total_subaward_amount,
-                    COUNT(*) AS subaward_count
-                FROM
-                    rpt.subaward_search
-                GROUP BY
-                    award_id
-            )
-            MERGE INTO
-                {award_table} AS a
-                    USING subaward_totals st
-                        ON (a.id = st.award_id
-                            AND (
-                                a.total_subaward_amount IS DISTINCT FROM st.total_subaward_amount
-                                OR a.subaward_count IS DISTINCT FROM COALESCE(st.subaward_count, 0)
-                            )
-                        )
-                WHEN matched THEN
-                    UPDATE SET
-                        a.update_date=NOW(),
-                        a.total_subaward_amount=st.total_subaward_amount,
-                        a.subaward_count=COALESCE(st.subaward_count, 0)
+
+        # Materialize the totals once; they are read both to bound the merge and by the merge itself
+        subaward_totals = self.spark.sql(
+            """
+            SELECT
+                award_id,
+                SUM(COALESCE(subaward_amount, 0)) AS total_subaward_amount,
+                COUNT(*) AS subaward_count
+            FROM
+                rpt.subaward_search
+            GROUP BY
+                award_id
         """
-        logger.info(
-            f"Updating {award_table} columns (total_subaward_amount, subaward_count) based on rpt.subaward_search."
-        )
-        self.spark.sql(update_award_query)
-        logger.info(f"{award_table} updated.")
+        ).cache()
+        try:
+            # One row per award with subawards is small next to raw.awards, so ship it to every executor rather than
+            # shuffling the awards table for the merge join
+            subaward_totals.hint("broadcast").createOrReplaceTempView("subaward_totals")
+            award_id_bounds = subaward_totals.selectExpr(
+                "MIN(award_id) AS min_award_id", "MAX(award_id) AS max_award_id"
+            ).first()
+
+            if award_id_bounds["min_award_id"] is None:
+                logger.info(f"No subawards found in rpt.subaward_search; {award_table} left unchanged.")
+            else:
+                # The award id range lets Delta skip target files whose id statistics fall outside of it
+                update_award_query = f"""
+                    MERGE INTO
+                        {award_table} AS a
+                            USING subaward_totals st
+                                ON (a.id = st.award_id
+                                    AND a.id BETWEEN {award_id_bounds["min_award_id"]} AND {award_id_bounds["max_award_id"]}
+                                    AND (
+                                        a.total_subaward_amount IS DISTINCT FROM st.total_subaward_amount
+                                        OR a.subaward_count IS DISTINCT FROM COALESCE(st.subaward_count, 0)
+                                    )
+                                )
+                        WHEN matched THEN
+                            UPDATE SET
+                                a.update_date=NOW(),
+                                a.total_subaward_amount=st.total_subaward_amount,
+                                a.subaward_count=COALESCE(st.subaward_count, 0)
+                """
+                logger.info(
+                    f"Updating {award_table} columns (total_subaward_amount, subaward_count) based on rpt.subaward_search."
+                )
+                self.spark.sql(update_award_query)
+                logger.info(f"{award_table} updated.")
+        finally:
+            subaward_totals.unpersist()
 
         if spark_created_by_command:
             self.spark.stop()
@@ -27,28 +27,28 @@ class Command(BaseCommand):
         load_naics(path=options["path"], append=options["append"])
 
 
-def populate_naics_fields(ws, naics_year, path):
-    for current_row, row in enumerate(ws.rows):
-        if not row[0].value:
+def populate_naics_fields(ws, naics_year, path, naics):
+    for code_cell, desc_cell in ws.iter_rows(max_col=2):
+        if not code_cell.value:
             break  # Reads file only until a blank line
 
-        naics_desc = row[1].value.strip()
+        naics_desc = desc_cell.value.strip()
 
         try:
-            naics_code = int(row[0].value)
-            load_single_naics(naics_code, naics_year, naics_desc)
+            naics_code = int(code_cell.value)
+            load_single_naics(naics_code, naics_year, naics_desc, naics)
         # Occasionally you will see more "creative" ways of listing naics. The following tries to account for common
         # patterns
         except ValueError:
-            load_naics_range(row[0].value, naics_year, naics_desc, path)
+            load_naics_range(code_cell.value, naics_year, naics_desc, path, naics)
 
 
-def load_naics_range(naics_range_string, naics_year, naics_desc, path):
+def load_naics_range(naics_range_string, naics_year, naics_desc, path, naics):
     if "-" in naics_range_string:
         try:
             minmax = naics_range_string.split("-")
             for naics_code in range(int(minmax[0].strip()), int(minmax[1].strip()) + 1):
-                load_single_naics(naics_code, naics_year, naics_desc)
+                load_single_naics(naics_code, naics_year, naics_desc, naics)
         except ValueError:
             raise CommandError(
                 "Unparsable NAICS range value: {0}. Please review file {1}".format(naics_range_string, path)
@@ -57,17 +57,37 @@ def load_naics_range(naics_range_string, naics_year, naics_desc, path):
         raise CommandError("Unparsable NAICS range value: {0}. Please review file {1}".format(naics_range_string, path))
 
 
-def load_single_naics(naics_code, naics_year, naics_desc):
+def load_single_naics(naics_code, naics_year, naics_desc, naics):
+    """Stage a NAICS code in `naics`, keeping the first description seen for the most recent year"""
 
     # crude way of ignoring naics of length 3 and 5
     if len(str(naics_code)) not in (2, 4, 6):
         return
 
-    obj, created = NAICS.objects.get_or_create(pk=naics_code, defaults={"description": naics_desc, "year": naics_year})
+    naics_code = str(naics_code)
+    if naics_code not in naics or int(naics_year) > int(naics[naics_code][1]):
+        naics[naics_code] = (naics_desc, naics_year)
 
-    if not created:
-        if int(naics_year) > int(obj.year):
-            NAICS.objects.filter(pk=naics_code).update(description=naics_desc, year=naics_year)
+
+def save_naics(naics):
+    """Create new NAICS codes and update existing ones from a more recent year using a handful of bulk queries"""
+    existing = NAICS.objects.in_bulk(list(naics))
+
+    to_create = []
+    to_update = []
+    for naics_code, (naics_desc, naics_year) in naics.items():
+        obj = existing.get(naics_code)
+        if obj is None:
+            to_create.append(NAICS(code=naics_code, description=naics_desc, year=naics_year))
+        elif int(naics_year) > int(obj.year):
+            obj.description = naics_desc
+            obj.year = naics_year
+            to_update.append(obj)
+
+    NAICS.objects.bulk_create(to_create, batch_size=1000)
+    NAICS.objects.bulk_update(to_update, ["description", "year"], batch_size=1000)
+
+    return len(to_create), len(to_update)
 
 
 @transaction.atomic
@@ -85,9 +105,16 @@ def load_naics(path, append):
 
     dir_files = glob.glob(path + "/*.xlsx")
 
+    # Stage every file's codes first so the database is only touched once for all of them
+    naics = {}
     for path in sorted(dir_files, reverse=True):
-        wb = load_workbook(filename=path)
-        ws = wb.active
+        # Stream cell values only; styles and the full cell graph are never needed here
+        wb = load_workbook(filename=path, read_only=True, data_only=True)
+        try:
+            naics_year = p_year.search(path).group()
+            populate_naics_fields(wb.active, naics_year, path, naics)
+        finally:
+            wb.close()
 
-        naics_year = p_year.search(path).group()
-        populate_naics_fields(ws, naics_year, path)
+    created, updated = save_naics(naics)
+    logger.info("Created {} and updated {} NAICS codes".format(created, updated))
@@ -2,7 +2,7 @@ from django.db import models
 from django_cte import CTEManager
 
 
-class GTASSF133Balances(models.Model):
+class AbstractGTASSF133Balances(models.Model):
     fiscal_year = models.IntegerField()
     fiscal_period = models.IntegerField()
     budget_authority_unobligated_balance_brought_forward_cpe = models.DecimalField(max_digits=23, decimal_places=2)
@@ -40,6 +40,12 @@ class GTASSF133Balances(models.Model):
     adjustments_to_unobligated_balance_brought_forward_cpe = models.DecimalField(
         max_digits=23, decimal_places=2, default=0.00
     )
+
+    class Meta:
+        abstract = True
+
+
+class GTASSF133Balances(AbstractGTASSF133Balances):
     objects = CTEManager()
 
     class Meta:
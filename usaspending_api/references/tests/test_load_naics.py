@@ -25,3 +25,18 @@ def test_naics_existing_and_new_files():
     assert naics_count_2002 == 15
     assert naics_count_2017 == 1392
     assert naics_count_all == 1627
+
+
+@pytest.mark.django_db
+def test_naics_append_updates_older_entries():
+    """
+    Test to make sure appending only replaces entries from an older year
+    """
+    NAICS.objects.create(code="541712", description="Old description", year=2000)
+    NAICS.objects.create(code="999999", description="Unlisted code", year=2000)
+
+    call_command("load_naics", "--append")
+
+    assert NAICS.objects.get(pk="541712").year == 2012
+    assert NAICS.objects.get(pk="999999").description == "Unlisted code"
+    assert NAICS.objects.count() == 1628
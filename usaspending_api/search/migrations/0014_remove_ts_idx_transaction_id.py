@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-15 20:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0013_subaward_search_schema'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transactionsearch',
+            name='ts_idx_transaction_id',
+        ),
+    ]
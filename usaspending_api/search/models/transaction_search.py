@@ -123,7 +123,6 @@ class TransactionSearch(models.Model):
     class Meta:
         db_table = "transaction_search"
         indexes = [
-            models.Index(fields=["transaction"], name="ts_idx_transaction_id"),
             models.Index(
                 fields=["-action_date"], name="ts_idx_action_date", condition=Q(action_date__gte="2007-10-01")
             ),
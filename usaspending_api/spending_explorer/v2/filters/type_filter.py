@@ -11,8 +11,8 @@ from usaspending_api.submissions.models import DABSSubmissionWindowSchedule
 
 UNREPORTED_DATA_NAME = "Unreported Data"
 UNREPORTED_FILE_C_NAME = "Non-Award Spending"
-VALID_UNREPORTED_DATA_TYPES = ["agency", "budget_function", "object_class"]
-VALID_UNREPORTED_FILTERS = ["fy", "quarter", "period"]
+VALID_UNREPORTED_DATA_TYPES = frozenset(["agency", "budget_function", "object_class"])
+VALID_UNREPORTED_FILTERS = frozenset(["fy", "quarter", "period"])
 
 
 def get_unreported_data_obj(
@@ -55,7 +55,7 @@ def get_unreported_data_obj(
         .values("obligations_incurred_total_cpe__sum")
     )
     expected_total = gtas[0]["obligations_incurred_total_cpe__sum"] if gtas else None
-    if spending_type in VALID_UNREPORTED_DATA_TYPES and set(filters.keys()).issubset(set(VALID_UNREPORTED_FILTERS)):
+    if spending_type in VALID_UNREPORTED_DATA_TYPES and VALID_UNREPORTED_FILTERS.issuperset(filters):
         unreported_obj = {"id": None, "code": None, "type": spending_type, "name": UNREPORTED_DATA_NAME, "amount": None}
         # if both values are actually available, then calculate the amount, otherwise leave it as the default of None
         if not (actual_total is None or expected_total is None):